@@ -2,18 +2,25 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 from flask import Flask
+from whitenoise import WhiteNoise
 from .config import config
 from .extensions import db, migrate
+from .json_provider import ORJSONProvider
 
 def create_app(config_name='default'):
     app = Flask(__name__)
     
     # Load configuration
     app.config.from_object(config.get(config_name, config['default']))
+    app.json = ORJSONProvider(app)
 
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
+
+    # Serve static assets from WhiteNoise so they bypass Flask routing
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=app.static_folder,
+                              prefix=app.static_url_path, autorefresh=app.debug)
     
     # Register blueprints
     from .routes.main import main_bp
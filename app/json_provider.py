@@ -0,0 +1,18 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.get_json."""
+
+    def dumps(self, obj, **kwargs):
+        # Datetimes fall through to Flask's default so they keep the HTTP date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default),
+                            option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
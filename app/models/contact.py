@@ -9,7 +9,7 @@ class Message(db.Model):
     email = db.Column(db.String(120))
     phone = db.Column(db.String(20))
     message = db.Column(db.Text)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     def __repr__(self):
         return f'<Message from {self.name}>'
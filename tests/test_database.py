@@ -0,0 +1,15 @@
+from sqlalchemy import create_engine, text
+from app.extensions import db
+
+def test_sqlite_pragmas_applied(app):
+    with app.app_context():
+        with db.engine.connect() as conn:
+            assert conn.execute(text('PRAGMA synchronous')).scalar() == 1
+            assert conn.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+            assert conn.execute(text('PRAGMA foreign_keys')).scalar() == 1
+
+def test_sqlite_wal_mode(tmp_path):
+    engine = create_engine('sqlite:///' + str(tmp_path / 'test.db'))
+    with engine.connect() as conn:
+        assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+    engine.dispose()
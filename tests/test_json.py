@@ -0,0 +1,8 @@
+from datetime import datetime
+
+def test_dumps_sorts_keys_and_formats_dates(app):
+    data = app.json.dumps({'b': 1, 'a': datetime(2025, 1, 5, 10, 30)})
+    assert data == '{"a":"Sun, 05 Jan 2025 10:30:00 GMT","b":1}'
+
+def test_loads_round_trip(app):
+    assert app.json.loads('{"name": "教会", "id": 1}') == {'name': '教会', 'id': 1}
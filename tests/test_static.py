@@ -0,0 +1,9 @@
+def test_static_asset_served(client):
+    response = client.get('/static/css/style.css')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/css'
+    assert 'max-age' in response.headers['Cache-Control']
+
+def test_missing_static_asset(client):
+    response = client.get('/static/css/missing.css')
+    assert response.status_code == 404